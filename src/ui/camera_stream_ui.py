@@ -1,88 +1,305 @@
 import cv2
+import sys
 import time
-import numpy as np
 import ctypes
+import functools
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+if sys.platform == 'win32':
+    # Make GetSystemMetrics report physical pixels rather than DPI-scaled ones
+    ctypes.windll.user32.SetProcessDPIAware()
+
+DEFAULT_SCREEN_RESOLUTION = (1920, 1080)
+
+
+@functools.lru_cache(maxsize=None)
+def get_screen_resolution():
+    """
+    Get the screen resolution (width, height) of the primary monitor.
+    The result is computed once and cached.
+    Returns:
+        tuple: (screen_width, screen_height)
+    """
+    if sys.platform == 'win32':
+        user32 = ctypes.windll.user32
+        return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+    if sys.platform.startswith('linux'):
+        try:
+            output = subprocess.run(['xrandr', '--current'], capture_output=True, text=True, check=True).stdout
+            for line in output.splitlines():
+                # The active mode is marked with '*', e.g. "   1920x1080     60.00*+"
+                if '*' in line:
+                    width, height = line.split()[0].split('x')
+                    return int(width), int(height)
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            pass
+    try:
+        import tkinter
+        root = tkinter.Tk()
+        root.withdraw()
+        resolution = root.winfo_screenwidth(), root.winfo_screenheight()
+        root.destroy()
+        return resolution
+    except Exception:
+        return DEFAULT_SCREEN_RESOLUTION
+
+
+def rounded_rect_mask(w, h, radius):
+    """
+    Rasterize a filled rounded rectangle in a single vectorized pass.
+    A pixel is inside when its distance to the nearest corner circle center, clamped to the
+    inner rectangle, is at most radius. Like OpenCV rectangles, both end points are included.
+    Args:
+        w (int): The width of the rectangle.
+        h (int): The height of the rectangle.
+        radius (int): The corner radius.
+    Returns:
+        np.ndarray: The (h+1, w+1) uint8 mask, 255 inside the rectangle and 0 outside.
+    """
+    ys = np.arange(h + 1)[:, None]
+    xs = np.arange(w + 1)[None, :]
+    dx = np.maximum(np.maximum(radius - xs, xs - (w - radius)), 0)
+    dy = np.maximum(np.maximum(radius - ys, ys - (h - radius)), 0)
+    return np.where(dx*dx + dy*dy <= radius*radius, 255, 0).astype(np.uint8)
+
 
 class CameraStreamUI:
     def __init__(self, camera_index=0):
         self.camera_index = camera_index
         self.cap = cv2.VideoCapture(self.camera_index)
-        self.prev_time = time.time()
+        self.prev_time = None  # time of the last rendered frame, None until the first one
         self.fps = 0
+        self._fps_ema = 0.0
+        self.fps_refresh_s = 0.25  # interval between updates of the displayed FPS value
+        self._fps_shown = 0  # FPS value currently displayed in the header
+        self._fps_shown_time = 0.0
         self.selected_filter = None  # 'red', 'green', 'blue', or None
-        self.header_height = 80
-        self.button_width = 200  # Increased width for modern buttons
-        self.button_height = 50
-        self.button_margin = 30
+        # The UI is rendered at this fraction of the screen resolution and upscaled once for display.
+        # Sizes below are in render pixels.
+        self.render_scale = 0.5
+        self.header_height = self._px(80)
+        self.button_width = self._px(200)  # Increased width for modern buttons
+        self.button_height = self._px(50)
+        self.button_margin = self._px(30)
         self.bg_color = (40, 40, 40)  # dark gray background
+        # Filter button palette (BGR), one row per button: red, green, blue
+        self._btn_names = ['Red', 'Green', 'Blue']
+        self._btn_base = np.array([[60,60,220], [60,220,60], [220,60,60]], dtype=np.uint8)  # muted
+        self._btn_sel = np.minimum(self._btn_base.astype(np.int16) + 60, 255).astype(np.uint8)
+        self._btn_icon = np.array([[36,36,255], [36,255,36], [255,36,36]], dtype=np.uint8)  # brighter for icon
+        # Offload the full-screen upscale to the GPU through OpenCV's OpenCL backend. Opt-in: the panel is
+        # uploaded and downloaded every frame, which only pays off on a real GPU device.
+        self.use_opencl = False
+        self.frame_budget_ms = 33  # target frame time (~30 FPS), the loop sleeps in waitKey for the remainder
+        self.stream_ratio = 1.2  # display scale of the camera frame in the stream panels
+        self._header_cache = {}  # selected_filter -> pre-rendered header without FPS
+        self._header_key = None  # (selected_filter, rounded FPS) currently drawn in the panel header
+        self._header_panel = None  # panel the header was last drawn into
+        self._button_sprites = None  # state -> filter name -> (bgr, mask), built on first use
+        self._glyph_cache = {}  # (font, scale, thickness, color) -> char -> glyph, see _get_glyph
+        self._filter_out = None  # output buffer of apply_filter
+        self._filter_masks = {'red': (0, 0, 255), 'green': (0, 255, 0), 'blue': (255, 0, 0)}  # BGR channel masks
+        self._buf_orig = None  # display-sized camera frame reused across frames, allocated in run
+        self._display_buf = None  # screen-sized upscaled panel (np.ndarray, or cv2.UMat with OpenCL), allocated in run
+        # Camera capture runs in its own thread and publishes the latest frame here
+        self._latest_frame = None
+        self._frame_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _px(self, size):
+        """
+        Convert a size given in screen pixels to render pixels.
+        """
+        return max(1, round(size * self.render_scale))
+
+    def _capture_loop(self):
+        """
+        Continuously read frames from the camera and keep only the most recent one.
+        Runs in a background thread until the stop event is set or a read fails.
+        """
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                print("Error: Failed to read frame.")
+                self._stop.set()
+                break
+            with self._frame_lock:
+                self._latest_frame = frame
 
     def update_fps(self):
         """
         Update the frames per second (FPS) value based on the time elapsed since the last frame.
+        The value is smoothed with an exponential moving average so the displayed FPS stays stable.
+        The first frame only starts the clock; the average is seeded from the first frame-to-frame interval.
         """
-        current_time = time.time()
-        self.fps = 1 / (current_time - self.prev_time)
+        current_time = time.perf_counter()
+        if self.prev_time is None:
+            self.prev_time = current_time
+            return
+        instant_fps = 1 / (current_time - self.prev_time)
+        self._fps_ema = instant_fps if self._fps_ema == 0 else 0.9 * self._fps_ema + 0.1 * instant_fps
+        self.fps = self._fps_ema
         self.prev_time = current_time
 
     def apply_filter(self, frame, color):
         """
         Apply a color filter (red, green, or blue) to the given frame.
+        The result is written into a buffer owned by the UI and reused across calls: it is only valid
+        until the next call, and callers must copy it if they need to keep it.
         Args:
             frame (np.ndarray): The input image frame.
             color (str): The color filter to apply ('red', 'green', or 'blue').
         Returns:
             np.ndarray: The filtered image frame.
         """
-        filtered = np.zeros_like(frame)
-        if color == 'red':
-            filtered[:, :, 2] = frame[:, :, 2]
-        elif color == 'green':
-            filtered[:, :, 1] = frame[:, :, 1]
-        elif color == 'blue':
-            filtered[:, :, 0] = frame[:, :, 0]
-        return filtered
+        h, w = frame.shape[:2]
+        if self._filter_out is None or self._filter_out.shape[:2] != (h, w):
+            self._filter_out = np.empty((h, w, 3), dtype=np.uint8)
+        # A single masked pass keeps the selected channel and zeroes the two others
+        return cv2.bitwise_and(frame, self._filter_masks.get(color, (0, 0, 0)), dst=self._filter_out)
 
-    def draw_header(self, panel, x, y, w, h):
+    def _build_button_sprites(self):
         """
-        Draw the header section at (x, y) with size (w, h), with modern styled buttons and updated UI colors.
+        Rasterize every filter button once, in its normal and selected state.
+        Returns:
+            dict: Maps state ('normal' or 'selected') and filter name to a (bgr, mask) pair of
+                (button_height+1, button_width+1) images, where the mask covers the rounded button shape.
         """
-        header_panel = panel[y:y+h, x:x+w]
+        # Opaque equivalent of a 92% blend of the base colors over the background
+        btn_normal = np.round(0.92 * self._btn_base + 0.08 * np.array(self.bg_color)).astype(np.uint8)
+        bw, bh = self.button_width, self.button_height
+        radius = self._px(18)
+        # Rounded rectangle shared by all buttons, one pixel larger than the button size
+        mask = rounded_rect_mask(bw, bh, radius)
+        sprites = {'normal': {}, 'selected': {}}
+        for i, name in enumerate(self._btn_names):
+            icon = tuple(int(c) for c in self._btn_icon[i])
+            for state, palette in [('normal', btn_normal), ('selected', self._btn_sel)]:
+                sprite = np.empty((bh+1, bw+1, 3), dtype=np.uint8)
+                sprite[:] = palette[i]
+                # Draw icon (filled circle)
+                cv2.circle(sprite, (self._px(30), bh//2), self._px(16), icon, -1)
+                # Draw button text
+                cv2.putText(sprite, name, (self._px(60), self._px(36)), cv2.FONT_HERSHEY_PLAIN,
+                            2.1 * self.render_scale, (240,240,240), self._px(2))
+                sprites[state][name.lower()] = (sprite, mask)
+        return sprites
+
+    def _get_glyph(self, char, key):
+        """
+        Get the pre-rasterized bitmap of a character, rendering it with cv2.putText on first use.
+        Args:
+            char (str): The character.
+            key (tuple): The text style as (font, scale, thickness, color).
+        Returns:
+            tuple: (bgr, alpha, inv_alpha, x_off, y_off, advance) where alpha is the float32 ink coverage,
+                (x_off, y_off) the offset of the bitmap top-left corner from the pen position on the baseline,
+                and advance the pen move to the next character.
+        """
+        glyphs = self._glyph_cache.setdefault(key, {})
+        glyph = glyphs.get(char)
+        if glyph is None:
+            font, scale, thickness, color = key
+            (w, h), baseline = cv2.getTextSize(char, font, scale, thickness)
+            # Generous padding so no stroke or anti-aliased edge is cut, then crop to the ink
+            pad = 2 * (h + thickness)
+            canvas = np.zeros((h + baseline + 2*pad, w + 2*pad), dtype=np.uint8)
+            cv2.putText(canvas, char, (pad, pad + h), font, scale, 255, thickness)
+            bx, by, bw, bh = cv2.boundingRect(canvas)
+            alpha = canvas[by:by+bh, bx:bx+bw].astype(np.float32) / 255
+            bgr = np.empty((bh, bw, 3), dtype=np.uint8)
+            bgr[:] = color
+            # The text size includes the stroke thickness once, the difference of two lengths does not
+            advance = cv2.getTextSize(char * 2, font, scale, thickness)[0][0] - w
+            glyph = (bgr, alpha, 1 - alpha, bx - pad, by - pad - h, advance)
+            glyphs[char] = glyph
+        return glyph
+
+    def _blit_text(self, img, text, org, key):
+        """
+        Draw a text by blending cached glyph bitmaps, as a cheaper replacement for cv2.putText on hot paths.
+        Glyphs are placed on whole pixels, so where cv2.putText positions strokes at sub-pixel offsets
+        (Hershey fonts at fractional scales on OpenCV 4) single strokes may land one pixel apart.
+        Args:
+            img (np.ndarray): The image to draw on.
+            text (str): The text to draw.
+            org (tuple): The (x, y) pen position of the text baseline start, as for cv2.putText.
+            key (tuple): The text style as (font, scale, thickness, color).
+        """
+        x, y = org
+        img_h, img_w = img.shape[:2]
+        for char in text:
+            bgr, alpha, inv_alpha, x_off, y_off, advance = self._get_glyph(char, key)
+            x1, y1 = x + x_off, y + y_off
+            x2, y2 = x1 + alpha.shape[1], y1 + alpha.shape[0]
+            # Clip the glyph to the image
+            cx1, cy1, cx2, cy2 = max(x1, 0), max(y1, 0), min(x2, img_w), min(y2, img_h)
+            if cx1 < cx2 and cy1 < cy2:
+                glyph_area = (slice(cy1 - y1, cy2 - y1), slice(cx1 - x1, cx2 - x1))
+                img_area = img[cy1:cy2, cx1:cx2]
+                cv2.blendLinear(bgr[glyph_area], img_area, alpha[glyph_area], inv_alpha[glyph_area], dst=img_area)
+            x += advance
+
+    def _render_header_base(self, w, h):
+        """
+        Rasterize the static part of the header (logo and filter buttons) for the current filter selection.
+        Args:
+            w (int): The width of the header.
+            h (int): The height of the header.
+        Returns:
+            np.ndarray: The (h, w, 3) header image, without the FPS text.
+        """
+        header_panel = np.full((h, w, 3), self.bg_color, dtype=np.uint8)
         # Draw "Percept3D" on the left
         cv2.putText(header_panel, "Percept3D", (self.button_margin, int(h * 0.65)),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.2, (220, 220, 220), 3)
-        # Modern button design
-        colors = [(60,60,220), (60,220,60), (220,60,60)]  # blue, green, red (muted)
-        names = ['Red', 'Green', 'Blue']
-        icons = [(36,36,255), (36,255,36), (255,36,36)]  # brighter for icon
-        total_buttons_width = 3 * self.button_width + 2 * self.button_margin
+                    cv2.FONT_HERSHEY_SIMPLEX, 1.2 * self.render_scale, (220, 220, 220), self._px(3))
+        # Modern button design, drawn opaque
+        if self._button_sprites is None:
+            self._button_sprites = self._build_button_sprites()
+        n_buttons = len(self._btn_names)
+        total_buttons_width = n_buttons * self.button_width + (n_buttons - 1) * self.button_margin
         panel_width = w
         start_x = (panel_width - total_buttons_width) // 2
         y_btn = (h - self.button_height) // 2
-        for i, (color, name, icon) in enumerate(zip(colors, names, icons)):
+        for i, btn_name in enumerate(self._btn_names):
+            name = btn_name.lower()
             x_btn = start_x + i * (self.button_width + self.button_margin)
-            # Draw rounded rectangle (simulate by overlaying circles at corners)
-            radius = 18
-            btn_rect = (x_btn, y_btn, self.button_width, self.button_height)
-            btn_color = color if self.selected_filter != name.lower() else tuple(min(255, c+60) for c in color)
-            overlay = header_panel.copy()
-            cv2.rectangle(overlay, (x_btn+radius, y_btn), (x_btn+self.button_width-radius, y_btn+self.button_height), btn_color, -1)
-            cv2.rectangle(overlay, (x_btn, y_btn+radius), (x_btn+self.button_width, y_btn+self.button_height-radius), btn_color, -1)
-            cv2.circle(overlay, (x_btn+radius, y_btn+radius), radius, btn_color, -1)
-            cv2.circle(overlay, (x_btn+self.button_width-radius, y_btn+radius), radius, btn_color, -1)
-            cv2.circle(overlay, (x_btn+radius, y_btn+self.button_height-radius), radius, btn_color, -1)
-            cv2.circle(overlay, (x_btn+self.button_width-radius, y_btn+self.button_height-radius), radius, btn_color, -1)
-            alpha = 0.92 if self.selected_filter != name.lower() else 1.0
-            cv2.addWeighted(overlay, alpha, header_panel, 1-alpha, 0, header_panel)
-            # Draw icon (filled circle)
-            icon_center = (x_btn+30, y_btn+self.button_height//2)
-            cv2.circle(header_panel, icon_center, 16, icon, -1)
-            # Draw button text
-            cv2.putText(header_panel, name, (x_btn+60, y_btn+36), cv2.FONT_HERSHEY_PLAIN, 2.1, (240,240,240), 2)
+            state = 'selected' if self.selected_filter == name else 'normal'
+            sprite, mask = self._button_sprites[state][name]
+            btn_area = header_panel[y_btn:y_btn+self.button_height+1, x_btn:x_btn+self.button_width+1]
+            cv2.copyTo(sprite, mask, btn_area)
+        return header_panel
+
+    def draw_header(self, panel, x, y, w, h):
+        """
+        Draw the header section at (x, y) with size (w, h), with modern styled buttons and updated UI colors.
+        The logo and buttons are rendered once per filter selection and cached. The panel header is only
+        repainted when the filter selection or the displayed FPS value changes; the displayed FPS value
+        is refreshed every fps_refresh_s seconds.
+        """
+        now = time.perf_counter()
+        if now - self._fps_shown_time >= self.fps_refresh_s:
+            self._fps_shown = self.fps
+            self._fps_shown_time = now
+        header_key = (self.selected_filter, self._fps_shown)
+        if header_key == self._header_key and panel is self._header_panel:
+            return
+        self._header_key = header_key
+        self._header_panel = panel
+        header_base = self._header_cache.get(self.selected_filter)
+        if header_base is None or header_base.shape[:2] != (h, w):
+            header_base = self._render_header_base(w, h)
+            self._header_cache[self.selected_filter] = header_base
+        header_panel = panel[y:y+h, x:x+w]
+        header_panel[:] = header_base
         # Draw FPS on the right side of the header
-        fps_text = f"FPS: {self.fps:.2f}"
-        (text_width, _), _ = cv2.getTextSize(fps_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)
-        cv2.putText(header_panel, fps_text, (panel_width - text_width - self.button_margin, int(h * 0.65)),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1, (220,220,220), 2)
+        fps_text = f"FPS: {self._fps_shown:.1f}"
+        fps_style = (cv2.FONT_HERSHEY_SIMPLEX, self.render_scale, self._px(2), (220,220,220))
+        (text_width, _), _ = cv2.getTextSize(fps_text, *fps_style[:3])
+        self._blit_text(header_panel, fps_text, (w - text_width - self.button_margin, int(h * 0.65)), fps_style)
 
     def get_button_clicked(self, x, y, panel_width):
         """
@@ -95,9 +312,11 @@ class CameraStreamUI:
             str or None: The name of the button clicked ('red', 'green', 'blue'), or None if no button was clicked.
         """
         # Centered buttons
-        total_buttons_width = 3 * self.button_width + 2 * self.button_margin
+        n_buttons = len(self._btn_names)
+        total_buttons_width = n_buttons * self.button_width + (n_buttons - 1) * self.button_margin
         start_x = (panel_width - total_buttons_width) // 2
-        for i, name in enumerate(['red', 'green', 'blue']):
+        for i, btn_name in enumerate(self._btn_names):
+            name = btn_name.lower()
             bx = start_x + i * (self.button_width + self.button_margin)
             by = (self.header_height - self.button_height) // 2
             if bx <= x <= bx+self.button_width and by <= y <= by+self.button_height:
@@ -109,11 +328,13 @@ class CameraStreamUI:
         Handle mouse click events to detect button presses in the header.
         Args:
             event: The OpenCV mouse event.
-            x (int): The x-coordinate of the mouse event.
-            y (int): The y-coordinate of the mouse event.
+            x (int): The x-coordinate of the mouse event, in screen pixels.
+            y (int): The y-coordinate of the mouse event, in screen pixels.
             flags: Any relevant flags passed by OpenCV.
             param (dict): Additional parameters, including panel width.
         """
+        # The window shows the upscaled panel, map the event back to render pixels
+        x, y = int(x * self.render_scale), int(y * self.render_scale)
         if event == cv2.EVENT_LBUTTONDOWN and y < self.header_height:
             panel_width = param['panel_width'] if param and 'panel_width' in param else 1920
             clicked = self.get_button_clicked(x, y, panel_width)
@@ -126,60 +347,51 @@ class CameraStreamUI:
         Returns:
             tuple: (screen_width, screen_height)
         """
-        user32 = ctypes.windll.user32
-        user32.SetProcessDPIAware()
-        return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+        return get_screen_resolution()
 
-    def draw_original_stream(self, panel, cam_frame, x, y, w, h, ratio=1.2):
+    def draw_original_stream(self, panel, stream_frame, x, y, w, h):
         """
-        Draw the original camera stream in the given rectangle, resizing and centering it to preserve aspect ratio.
+        Draw the original camera stream centered in the given rectangle.
+        Args:
+            stream_frame (np.ndarray): The camera frame, already flipped and resized to its display size.
         """
-        cam_frame = cv2.flip(cam_frame, 1)
         xc, yc = x + w//2, y + h//2
 
-        h_f, w_f = cam_frame.shape[:2]
-        aspect = w_f / h_f
-
-        display_w = int(w_f * ratio)
-        display_h = int(display_w / aspect)
-
-        resized = cv2.resize(cam_frame, (display_w, display_h))
+        display_h, display_w = stream_frame.shape[:2]
         x1 = xc - display_w // 2
         y1 = yc - display_h // 2
-        panel[y1:y1+display_h, x1:x1+display_w] = resized
+        panel[y1:y1+display_h, x1:x1+display_w] = stream_frame
 
         return x1, y1, display_h, display_w
 
-    def draw_processed_stream(self, panel, cam_frame, x, y, w, h, ratio=1.2):
+    def draw_processed_stream(self, panel, stream_frame, x, y, w, h):
         """
-        Draw the processed (filtered) camera stream in the given rectangle, resizing and centering it to preserve aspect ratio.
+        Draw the processed (filtered) camera stream centered in the given rectangle.
+        The filter is applied on the display-sized frame rather than the full camera resolution.
+        Args:
+            stream_frame (np.ndarray): The camera frame, already flipped and resized to its display size.
         """
-        cam_frame = cv2.flip(cam_frame, 1)
         if self.selected_filter:
-            proc_frame = self.apply_filter(cam_frame, self.selected_filter)
+            proc_frame = self.apply_filter(stream_frame, self.selected_filter)
         else:
-            proc_frame = cam_frame.copy()
+            # Without a filter the processed stream is the original one; blit it as is
+            proc_frame = stream_frame
         xc, yc = x + w//2, y + h//2
 
-        h_f, w_f = proc_frame.shape[:2]
-        aspect = w_f / h_f
-
-        display_w = int(w_f * ratio)
-        display_h = int(display_w / aspect)
-
-        resized = cv2.resize(proc_frame, (display_w, display_h))
+        display_h, display_w = proc_frame.shape[:2]
         x1 = xc - display_w // 2
         y1 = yc - display_h // 2
-        panel[y1:y1+display_h, x1:x1+display_w] = resized
+        panel[y1:y1+display_h, x1:x1+display_w] = proc_frame
 
         return x1, y1, display_h, display_w
 
     def draw_footer(self, panel, x, y, w, h):
         """
         Draw the footer panel at (x, y) with size (w, h), with a modern color.
+        The footer is static: run draws it once into the persistent panel, before the frame loop.
         """
         cv2.rectangle(panel, (x, y), (x+w, y+h), (30, 34, 40), -1)
-        # Optionally, add text or info here
+        # Optionally, add text or info here (anything dynamic must then be redrawn in the frame loop)
 
     def run(self):
         """
@@ -189,6 +401,8 @@ class CameraStreamUI:
         if not self.cap.isOpened():
             print("Error: Could not open camera.")
             return
+        use_opencl = self.use_opencl and cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(use_opencl)
         window_name = 'Percept3D'
         cv2.namedWindow(window_name, cv2.WND_PROP_FULLSCREEN)
         cv2.setWindowProperty(window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
@@ -198,37 +412,76 @@ class CameraStreamUI:
             return
         cam_h, cam_w, _ = frame.shape
         cam_aspect = cam_w / cam_h
+        # Both stream panels share a single resize of the camera frame
+        display_w = int(cam_w * self.stream_ratio * self.render_scale)
+        display_h = int(display_w / cam_aspect)
+        self._buf_orig = np.empty((display_h, display_w, 3), dtype=np.uint8)
         # Get screen size
         screen_w, screen_h = self.get_screen_resolution()
+        render_w, render_h = int(screen_w * self.render_scale), int(screen_h * self.render_scale)
         # Compute panel heights
-        header_height = int(0.10 * screen_h)
-        footer_height = int(0.10 * screen_h)
-        stream_panel_height = screen_h - header_height - footer_height
-        stream_panel_width = screen_w // 2
+        header_height = int(0.10 * render_h)
+        footer_height = int(0.10 * render_h)
+        stream_panel_height = render_h - header_height - footer_height
+        stream_panel_width = render_w // 2
+        self.header_height = header_height  # keep click detection aligned with the drawn header
         # Panel positions (x, y, w, h)
-        header_rect = (0, 0, screen_w, header_height)
-        footer_rect = (0, screen_h - footer_height, screen_w, footer_height)
+        header_rect = (0, 0, render_w, header_height)
+        footer_rect = (0, render_h - footer_height, render_w, footer_height)
         orig_rect = (0, header_height, stream_panel_width, stream_panel_height)
         proc_rect = (stream_panel_width, header_height, stream_panel_width, stream_panel_height)
-        cv2.setMouseCallback(window_name, self.mouse_callback, param={'panel_width': screen_w})
-        while True:
-            ret, frame = self.cap.read()
-            if not ret:
-                print("Error: Failed to read frame.")
-                break
+        cv2.setMouseCallback(window_name, self.mouse_callback, param={'panel_width': render_w})
+        # The panel is filled once; each frame only repaints the header and the two stream images,
+        # which always cover the same regions. The footer is static and never repainted.
+        panel = np.full((render_h, render_w, 3), self.bg_color, dtype=np.uint8)
+        if use_opencl:
+            self._display_buf = cv2.UMat(screen_h, screen_w, cv2.CV_8UC3)
+        else:
+            self._display_buf = np.empty((screen_h, screen_w, 3), dtype=np.uint8)
+        self.draw_header(panel, *header_rect)
+        self.draw_footer(panel, *footer_rect)
+        self._latest_frame = frame
+        self._stop.clear()
+        capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        capture_thread.start()
+        # Start FPS measurement from the first rendered frame, so startup is not counted as a frame interval
+        self.prev_time = None
+        self._fps_ema = 0.0
+        # The two stream panels write disjoint regions of the panel and are drawn in parallel
+        draw_pool = ThreadPoolExecutor(max_workers=2)
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            # Take the freshest frame, if a new one arrived since the last iteration
+            with self._frame_lock:
+                frame, self._latest_frame = self._latest_frame, None
+            if frame is None:
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+                continue
             self.update_fps()
-            panel = np.full((screen_h, screen_w, 3), self.bg_color, dtype=np.uint8)
             # Draw header
             self.draw_header(panel, *header_rect)
-            # Draw footer
-            self.draw_footer(panel, *footer_rect)
-            # Draw original stream
-            _ = self.draw_original_stream(panel, frame, *orig_rect)
-            # Draw processed stream
-            _ = self.draw_processed_stream(panel, frame, *proc_rect)
-            cv2.imshow(window_name, panel)
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            # Resize once for both stream panels
+            resized = cv2.resize(frame, (display_w, display_h), dst=self._buf_orig, interpolation=cv2.INTER_LINEAR)
+            stream_frame = cv2.flip(resized, 1, dst=resized)
+            # Draw original and processed streams in parallel (OpenCV releases the GIL)
+            orig_job = draw_pool.submit(self.draw_original_stream, panel, stream_frame, *orig_rect)
+            proc_job = draw_pool.submit(self.draw_processed_stream, panel, stream_frame, *proc_rect)
+            orig_job.result()
+            proc_job.result()
+            # Upscale the panel to the screen in a single pass
+            if use_opencl:
+                display = cv2.resize(cv2.UMat(panel), (screen_w, screen_h), dst=self._display_buf, interpolation=cv2.INTER_LINEAR)
+            else:
+                display = cv2.resize(panel, (screen_w, screen_h), dst=self._display_buf, interpolation=cv2.INTER_LINEAR)
+            cv2.imshow(window_name, display)
+            # Yield the rest of the frame budget to the OS instead of spinning
+            elapsed_ms = int((time.perf_counter() - t0) * 1000)
+            if cv2.waitKey(max(1, self.frame_budget_ms - elapsed_ms)) & 0xFF == ord('q'):
                 break
+        self._stop.set()
+        capture_thread.join()
+        draw_pool.shutdown()
         self.cap.release()
         cv2.destroyAllWindows()
 